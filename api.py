@@ -0,0 +1,62 @@
+"""
+Stateless entry points for parsing.
+
+Every call builds its own Lexer and Parser so no scanning state is shared, which makes these
+functions safe to call from many threads at once. On free-threaded CPython (3.13t+) the
+parses of parse_many then run on separate cores.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional
+
+import cache
+from lexer import Lexer, PathType, SourceType, Token
+from parser import ObjectFactory, Parser
+
+
+def loads(source: SourceType, object_factory: Optional[ObjectFactory] = None) -> Any:
+    """Parse a JSON document from a string"""
+    return parse_document(Lexer(source=source).tokenize(), object_factory)
+
+
+def load(
+    path: PathType,
+    object_factory: Optional[ObjectFactory] = None,
+    cache_dir: Optional[PathType] = None
+) -> Any:
+    """Parse a JSON file, going through the pre-parsed cache in cache_dir when given"""
+    if cache_dir is not None:
+        if object_factory is not None:
+            raise ValueError("Cannot specify both object_factory and cache_dir")
+        return cache.load(path, cache_dir=cache_dir)
+
+    return parse_document(Lexer(path=path).tokenize(), object_factory)
+
+
+def parse_document(tokens: List[Token], object_factory: Optional[ObjectFactory]) -> Any:
+    """Parse exactly one <json>, tokens left over after it are an error"""
+    parser = Parser(tokens, object_factory)
+    res = parser.parse_json()
+
+    if not parser.is_at_end():
+        raise Exception(f"Unexpected token after document, got {parser.peek()}")
+
+    return res
+
+
+def parse_many(
+    sources: Iterable[SourceType],
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    object_factory: Optional[ObjectFactory] = None
+) -> List[Any]:
+    """
+    Parse several documents concurrently, results are returned in the order of sources.
+    Without an executor a ThreadPoolExecutor with max_workers threads is used for the batch.
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return parse_many(sources, pool, object_factory=object_factory)
+
+    futures = [executor.submit(loads, source, object_factory) for source in sources]
+    return [future.result() for future in futures]
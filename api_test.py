@@ -0,0 +1,94 @@
+import pytest
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from api import load, loads, parse_many
+from records import Record, RecordFactory
+
+
+def test_loads():
+    assert {"key": [1, 2.5, "three", None]} == loads('{"key": [1, 2.5, "three", null]}')
+
+def test_keyword_documents():
+    assert None is loads('null')
+    assert False is loads('false')
+    assert True is loads(' true\n')
+
+def test_trailing_content():
+    for json_input in ['{} x', '[1] ]', '{} {}', '[1], [2]', '"a" : 1', '{} @']:
+        with pytest.raises(Exception):
+            loads(json_input)
+
+def test_parse_many_keyword_documents():
+    assert [[1], False, None] == parse_many(['[1]', 'false', 'null'], max_workers=2)
+
+def test_load():
+    result = load('./examples/server.json')
+
+    assert result["name"] == "Cake"
+    assert len(result["topping"]) == 7
+
+def test_load_with_cache(tmp_path):
+    assert load('./examples/server.json') == load('./examples/server.json', cache_dir=tmp_path)
+
+    with pytest.raises(ValueError):
+        load('./examples/server.json', object_factory=RecordFactory(), cache_dir=tmp_path)
+
+def test_parse_many_keeps_order():
+    sources = [f'{{"index": {i}, "items": {list(range(i))}}}' for i in range(50)]
+
+    assert [{"index": i, "items": list(range(i))} for i in range(50)] == parse_many(sources, max_workers=8)
+
+def test_parse_many_with_executor():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert [[1], [2], [3]] == parse_many(['[1]', '[2]', '[3]'], executor=executor)
+
+def test_parse_many_propagates_errors():
+    with pytest.raises(Exception):
+        parse_many(['[1]', '{"key": "value",}'], max_workers=2)
+
+def test_shared_record_factory():
+    factory = RecordFactory()
+    sources = ['{"id": %d, "name": "item"}' % i for i in range(200)]
+    barrier = threading.Barrier(4)
+
+    def parse(chunk):
+        barrier.wait()
+        return [loads(source, factory) for source in chunk]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = [record for chunk in executor.map(parse, [sources[i::4] for i in range(4)]) for record in chunk]
+
+    assert all(isinstance(record, Record) for record in results)
+    assert len(factory.classes) == 1
+    assert sorted(record.id for record in results) == list(range(200))
+
+def test_parse_many_in_processes():
+    factory = RecordFactory()
+    loads('{"id": 0, "name": "warm"}', factory)
+    sources = ['{"id": %d, "name": "item"}' % i for i in range(20)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = parse_many(sources, executor=executor, object_factory=factory)
+
+    assert [record.id for record in results] == list(range(20))
+    assert all(isinstance(record, Record) for record in results)
+
+def test_pickle_record_factory():
+    import pickle
+
+    factory = RecordFactory()
+    loads('[{"a": 1}, {"b": 2}]', factory)
+    restored = pickle.loads(pickle.dumps(factory))
+
+    assert list(restored.classes) == [("a",), ("b",)]
+    assert restored.lock is not factory.lock
+    assert loads('{"a": 1}', restored).a == 1
+
+def test_pickle_record_factory_unslottable():
+    import pickle
+
+    factory = RecordFactory()
+    loads('{"not slottable": 1}', factory)
+    restored = pickle.loads(pickle.dumps(factory))
+
+    assert restored.unslottable == {("not slottable",)}
@@ -0,0 +1,47 @@
+"""
+Thread scaling of api.parse_many.
+
+Parses the same batch of documents with 1, 2, 4, ... threads and prints the speedup over a
+single thread. With the GIL the parses are serialized so expect ~1x, free-threaded CPython
+(3.13t+, PYTHON_GIL=0) should scale with the number of cores.
+
+    python benchmark.py [documents] [max threads]
+"""
+
+import os
+import sys
+import time
+
+from api import parse_many
+
+
+def make_document(i: int) -> str:
+    items = ", ".join(
+        f'{{"id": {i * 100 + j}, "name": "item {j}", "price": {j * 1.25}, "tags": ["a", "b\\\\n"], "active": true}}'
+        for j in range(100)
+    )
+    return f'{{"batch": {i}, "items": [{items}]}}'
+
+
+def run(documents: int, max_threads: int) -> None:
+    sources = [make_document(i) for i in range(documents)]
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} cpus")
+    print(f"{documents} documents, {sum(map(len, sources)) / 1e6:.1f} MB")
+
+    baseline = None
+    threads = 1
+
+    while threads <= max_threads:
+        start = time.perf_counter()
+        parse_many(sources, max_workers=threads)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{threads:>3} threads: {elapsed:.3f}s  speedup {baseline / elapsed:.2f}x")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    max_threads = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    run(documents, max_threads)
@@ -0,0 +1,131 @@
+"""
+On-disk pre-parsed cache for large JSON files that rarely change.
+
+The first load of a file parses it normally and writes its tape (see tape.py) to the cache
+directory, later loads mmap the cached tape and decode it without lexing. A cache file is
+only used when the source's mtime, size and sha256 all still match the ones recorded in its
+header, and it is written to a temporary file then renamed so concurrent loaders never see
+a partially written cache.
+
+<cache file> ::= 'JCC1' mtime_ns:int64 size:uint64 sha256:32 bytes <tape>
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from lexer import Lexer, PathType
+from parser import Parser
+from tape import MAGIC as TAPE_MAGIC, build_tape, read_value
+
+MAGIC = b"JCC1"
+HEADER = struct.Struct("<4sqQ32s")
+DIGEST_CHUNK_SIZE = 1 << 20
+
+# sentinel since None is a valid JSON document
+CACHE_MISS = object()
+
+
+def load(path: PathType, cache_dir: Optional[PathType] = None, verify_hash: bool = True) -> Any:
+    """
+    Parse the JSON file at path, going through the pre-parsed cache when cache_dir is given.
+    verify_hash=False trusts a matching mtime and size and skips re-hashing the source.
+    """
+    if cache_dir is None:
+        return Parser(Lexer(path=path).tokenize()).parse_json()
+
+    stat = os.stat(path)
+    cache_path = cache_file(path, cache_dir)
+    digest = None
+
+    if cache_path.exists():
+        if verify_hash:
+            digest = source_digest(path)
+        value = read_cache(cache_path, stat.st_mtime_ns, stat.st_size, digest)
+        if value is not CACHE_MISS:
+            return value
+
+    if digest is None:
+        digest = source_digest(path)
+
+    tape = build_tape(Lexer(path=path).tokenize())
+
+    try:
+        write_cache(cache_path, tape, stat.st_mtime_ns, stat.st_size, digest)
+    except OSError:
+        # the cache is only an optimisation, a read-only or full disk must not fail the load
+        pass
+
+    return read_value(tape, len(TAPE_MAGIC))[0]
+
+
+def cache_file(path: PathType, cache_dir: PathType) -> Path:
+    """Cache file for a source, named after the hash of its absolute path"""
+    name = hashlib.sha256(str(Path(path).resolve()).encode("utf-8")).hexdigest()
+    return Path(cache_dir) / f"{name}.jtape"
+
+
+def source_digest(path: PathType) -> bytes:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        while chunk := f.read(DIGEST_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.digest()
+
+
+def read_cache(cache_path: Path, mtime_ns: int, size: int, digest: Optional[bytes]) -> Any:
+    """Decode a cache file if it still matches the source, otherwise return CACHE_MISS"""
+    try:
+        with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < HEADER.size + len(TAPE_MAGIC):
+                return CACHE_MISS
+
+            magic, cached_mtime, cached_size, cached_digest = HEADER.unpack_from(mm, 0)
+
+            if magic != MAGIC or cached_mtime != mtime_ns or cached_size != size:
+                return CACHE_MISS
+            if digest is not None and cached_digest != digest:
+                return CACHE_MISS
+            if mm[HEADER.size: HEADER.size + len(TAPE_MAGIC)] != TAPE_MAGIC:
+                return CACHE_MISS
+
+            return read_value(mm, HEADER.size + len(TAPE_MAGIC))[0]
+    except (OSError, ValueError):
+        # unreadable or empty cache file, just rebuild it
+        return CACHE_MISS
+
+
+def write_cache(cache_path: Path, tape: bytearray, mtime_ns: int, size: int, digest: bytes) -> None:
+    """Atomically replace cache_path with the header and tape"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, mtime_ns, size, digest))
+            f.write(tape)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "./examples/server_complex.json"
+    cache_dir = tempfile.mkdtemp()
+
+    for label in ("cold", "cached"):
+        start = time.perf_counter()
+        load(path, cache_dir=cache_dir)
+        print(f"{label}: {time.perf_counter() - start:.4f}s")
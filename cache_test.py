@@ -0,0 +1,106 @@
+import os
+import pytest
+import cache
+from lexer import Lexer
+from parser import Parser
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.json"
+    path.write_text(open('./examples/server_complex.json').read())
+    return path
+
+@pytest.fixture
+def no_lexing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("source was lexed instead of read from the cache")
+    monkeypatch.setattr(cache, "Lexer", fail)
+
+
+def test_load_without_cache(source):
+    assert Parser(Lexer(path=source).tokenize()).parse_json() == cache.load(source)
+
+def test_first_load_writes_cache(source, tmp_path):
+    cache_dir = tmp_path / "cache"
+    result = cache.load(source, cache_dir=cache_dir)
+
+    assert Parser(Lexer(path=source).tokenize()).parse_json() == result
+    assert cache.cache_file(source, cache_dir).exists()
+    assert not [name for name in os.listdir(cache_dir) if name.endswith(".tmp")]
+
+def test_second_load_uses_cache(source, tmp_path, request):
+    cache_dir = tmp_path / "cache"
+    expected = cache.load(source, cache_dir=cache_dir)
+
+    request.getfixturevalue("no_lexing")
+
+    assert expected == cache.load(source, cache_dir=cache_dir)
+    assert expected == cache.load(source, cache_dir=cache_dir, verify_hash=False)
+
+def test_modified_source_invalidates_cache(source, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache.load(source, cache_dir=cache_dir)
+
+    source.write_text('{"replaced": [1, 2, 3]}')
+
+    assert {"replaced": [1, 2, 3]} == cache.load(source, cache_dir=cache_dir)
+
+def test_same_size_and_mtime_invalidated_by_hash(source, tmp_path):
+    cache_dir = tmp_path / "cache"
+    source.write_text('{"value": 1}')
+    cache.load(source, cache_dir=cache_dir)
+    stat = os.stat(source)
+
+    source.write_text('{"value": 2}')
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert {"value": 2} == cache.load(source, cache_dir=cache_dir)
+
+def test_corrupt_cache_is_rebuilt(source, tmp_path):
+    cache_dir = tmp_path / "cache"
+    expected = cache.load(source, cache_dir=cache_dir)
+
+    cache.cache_file(source, cache_dir).write_bytes(b"garbage")
+
+    assert expected == cache.load(source, cache_dir=cache_dir)
+
+def test_null_document(tmp_path):
+    path = tmp_path / "null.json"
+    path.write_text('[null]')
+    cache.load(path, cache_dir=tmp_path)
+
+    assert [None] == cache.load(path, cache_dir=tmp_path)
+
+def test_unwritable_cache_dir(source, tmp_path):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+
+    assert Parser(Lexer(path=source).tokenize()).parse_json() == cache.load(source, cache_dir=not_a_dir)
+
+def test_failed_write_leaves_no_temp_file(source, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    def fail(*args, **kwargs):
+        raise OSError("No space left on device")
+    monkeypatch.setattr(cache.os, "fsync", fail)
+
+    assert Parser(Lexer(path=source).tokenize()).parse_json() == cache.load(source, cache_dir=cache_dir)
+    assert [] == list(cache_dir.iterdir())
+
+def test_source_digest(source):
+    import hashlib
+
+    assert hashlib.sha256(source.read_bytes()).digest() == cache.source_digest(source)
+
+def test_keyword_document(tmp_path, request):
+    path = tmp_path / "true.json"
+    path.write_text('true\n')
+    cache_dir = tmp_path / "cache"
+
+    assert True is cache.load(path, cache_dir=cache_dir)
+    assert cache.cache_file(path, cache_dir).exists()
+
+    request.getfixturevalue("no_lexing")
+
+    assert True is cache.load(path, cache_dir=cache_dir)
@@ -1,3 +1,4 @@
+import re
 from enum import Enum, auto
 from typing import List, Optional, overload, TypeAlias
 from pathlib import Path
@@ -26,6 +27,20 @@ class Token:
         return f"\n Type: {self.tokenType}\n Value: {self.value}\n Line: {self.line}\n Column {self.column}\n"
 
 
+# longest run of string characters that need no decoding
+STRING_RUN = re.compile(r'[^"\\]*')
+
+ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+}
+
 SourceType: TypeAlias = str
 PathType: TypeAlias = str | Path 
 
@@ -55,8 +70,8 @@ class Lexer:
         self.column = 0
 
     def tokenize(self) -> List[Token]:
+        self.lex_whitespace()
         while not self.is_at_end():
-            self.lex_whitespace()
             self.lex_token()
             self.lex_whitespace()
         return self.tokens
@@ -67,66 +82,101 @@ class Lexer:
         match char:
             case '{': self.lex_object()
             case '[': self.lex_array()
-            case ',': self.add_token(TokenType.COMMA, ',')
-            case ':': self.add_token(TokenType.COLON, ':')
             case '"': self.lex_string()
+            case ',':
+                self.add_token(TokenType.COMMA, ',')
+                self.advance()
+            case ':':
+                self.add_token(TokenType.COLON, ':')
+                self.advance()
+            case _:
+                if self.is_digit(char) or char == '-':
+                    self.lex_number()
+                elif char.isalpha():
+                    self.lex_keyword()
+                else:
+                    # every branch has to consume input or tokenize never ends
+                    raise Exception(f"Unexpected character: {char} at line {self.line} and col {self.column}")
 
-        if self.is_digit(char) or char == '-': self.lex_number()
-  
 
     def lex_string(self):
-        res = ""
+        chunks = []
 
         # skip the first "
         start_col = self.column
         self.advance()
 
-        while not self.is_at_end() and self.peek() != '"':
-            # reset col and increment line
-            if self.peek() == '\n':
-                self.line += 1
-                self.column = 0
+        while True:
+            # copy everything up to the next quote or backslash in one go
+            run_end = STRING_RUN.match(self.source, self.current).end()
 
-            if self.peek() == '\\':
-                self.advance()
+            if run_end > self.current:
+                chunks.append(self.consume_run(run_end))
 
-                escapes = {
-                    'n': '\n',
-                    't': '\t',
-                    'r': '\r',
-                    'f': '\f',
-                    'b': '\b',
-                    '\\': '\\',
-                    '"': '"',
-                    '/': '/'
-                }
-
-                if self.peek() in escapes:
-                    res += escapes[self.advance()]
-                elif self.peek() == 'u':
-                    self.advance()
+            if self.is_at_end():
+                raise Exception("Expected string terminator received end of stream")
 
-                    # need to now have 4 hex digits for proper unicode
-                    hex = ""
+            if self.peek() == '"':
+                break
 
-                    for _ in range(4):
-                        if not self.is_hex_digit(self.peek()):
-                            raise Exception(f"Expected unicode hex digit, received {self.peek()} at line {self.line} and col {self.column}")
-                        hex += self.advance()
-                    res += hex
-                else:
-                    raise Exception(f"Expected escape sequence, received {self.peek()} at line {self.line} and col {self.column}")
-            else:
-                # normal string char
-                res += self.advance()
+            # backslash
+            self.advance()
+            char = self.peek()
 
-        if self.is_at_end():
-            raise Exception("Expected string terminator received end of stream")
+            if char in ESCAPES:
+                self.advance()
+                chunks.append(ESCAPES[char])
+            elif char == 'u':
+                self.advance()
+                code = self.lex_unicode_escape()
+
+                # a high surrogate followed by a low surrogate escape combine into one code point
+                if 0xD800 <= code <= 0xDBFF and self.peek() == '\\' and self.peek2() == 'u':
+                    low_start = self.current
+                    self.advance()
+                    self.advance()
+                    low = self.lex_unicode_escape()
+                    if 0xDC00 <= low <= 0xDFFF:
+                        code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                    else:
+                        # not a pair, leave the second escape for the next iteration
+                        self.column -= self.current - low_start
+                        self.current = low_start
+
+                chunks.append(chr(code))
+            else:
+                raise Exception(f"Expected escape sequence, received {char} at line {self.line} and col {self.column}")
 
         # fall through which means valid and that the cur char is terminator 
-        self.add_token(TokenType.STR, res, start_col)
+        self.add_token(TokenType.STR, "".join(chunks), start_col)
         self.advance()
 
+    def lex_unicode_escape(self) -> int:
+        # need to now have 4 hex digits for proper unicode
+        hex = self.source[self.current: self.current + 4]
+
+        for char in hex.ljust(4, '\0'):
+            if not self.is_hex_digit(char):
+                raise Exception(f"Expected unicode hex digit, received {char} at line {self.line} and col {self.column}")
+
+        self.current += 4
+        self.column += 4
+        return int(hex, 16)
+
+    def consume_run(self, run_end: int) -> str:
+        """Advance over source[current:run_end] keeping line and column in sync"""
+        run = self.source[self.current: run_end]
+        newlines = run.count('\n')
+
+        if newlines:
+            self.line += newlines
+            self.column = len(run) - run.rfind('\n')
+        else:
+            self.column += len(run)
+
+        self.current = run_end
+        return run
+
     def lex_number(self):
         res = ''
         start_col = self.column
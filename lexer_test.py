@@ -61,6 +61,45 @@ def test_escaped_strings(lexer):
     assert tokens[0].tokenType == TokenType.LBRACE
     assert tokens[-1].tokenType == TokenType.RBRACE
 
+    values = [token.value for token in tokens if token.tokenType == TokenType.STR][1::2]
+    assert values == [
+        "This is a string",
+        'She said, "Hello!"',
+        "Line 1\nLine 2",
+        "Column1\tColumn2",
+        "This is a backslash: \\",
+        "Emoji: \U0001F680",
+        'This "string" has \t multiple\nescapes \\ and unicode \u2603',
+    ]
+
+def test_unicode_escapes(lexer):
+    json_input = '["\\u00e9\\u00E9", "\\uD83D", "\\uD83D\\u0041", "\\uDE80\\uD83D", "\\/\\b\\f\\r"]'
+    tokens = lexer(source=json_input).tokenize()
+    values = [token.value for token in tokens if token.tokenType == TokenType.STR]
+
+    # lone or out of order surrogates are kept as their own code points
+    assert values == ["\u00e9\u00e9", "\ud83d", "\ud83dA", "\ude80\ud83d", "/\b\f\r"]
+
+def test_invalid_escapes(lexer):
+    with pytest.raises(Exception):
+        lexer(source='["\\x41"]').tokenize()
+    with pytest.raises(Exception):
+        lexer(source='["\\u12G4"]').tokenize()
+    with pytest.raises(Exception):
+        lexer(source='["\\u12"]').tokenize()
+    with pytest.raises(Exception):
+        lexer(source='["unterminated').tokenize()
+
+def test_string_positions(lexer):
+    json_input = '["a\\nb", "multi\nline", "x"]'
+    tokens = lexer(source=json_input).tokenize()
+
+    assert [(token.value, token.line, token.column) for token in tokens if token.tokenType == TokenType.STR] == [
+        ("a\nb", 1, 1),
+        ("multi\nline", 2, 9),
+        ("x", 2, 8),
+    ]
+
 def test_numbers(lexer):
     json_input = '''{
       "integer": 42,
@@ -134,3 +173,13 @@ def test_server_complex_file(lexer):
     ]
     for value in string_values:
         assert any(token.tokenType == TokenType.STR and token.value == value for token in tokens)
+
+def test_top_level_keywords(lexer):
+    for json_input, tokenType in [('true', TokenType.BOOL), ('false', TokenType.BOOL), (' null ', TokenType.NULL)]:
+        tokens = lexer(source=json_input).tokenize()
+        assert [token.tokenType for token in tokens] == [tokenType]
+
+def test_unexpected_characters(lexer):
+    for json_input in ['{} x', '[1] @', '}', 'nul']:
+        with pytest.raises(Exception):
+            lexer(source=json_input).tokenize()
@@ -14,12 +14,16 @@
 
 """
 
-from typing import Dict, List, Any, Union 
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union 
 from lexer import Lexer, Token, TokenType
 
+# builds the value for an <object> from its (key, value) members, e.g. dict or records.RecordFactory()
+ObjectFactory = Callable[[List[Tuple[str, Any]]], Any]
+
 class Parser:
-    def __init__(self, tokens : List[Token]) -> None:
+    def __init__(self, tokens : List[Token], object_factory: Optional[ObjectFactory] = None) -> None:
         self.tokens = tokens
+        self.object_factory = object_factory
         # index into the token array
         self.current = 0
         self.res = {}
@@ -72,6 +76,7 @@ class Parser:
         res = []
 
         if self.peek().tokenType == TokenType.RBRACKET:
+            self.advance()
             return res
 
         res.append(self.parse_json())
@@ -90,8 +95,11 @@ class Parser:
         
         return res
     
-    def parse_object(self) -> Dict:
+    def parse_object(self) -> Any:
         """<object> ::= '{' [ <member> *(', ' <member>) ] '}' ; A sequence of 'members'"""
+        if self.object_factory is not None:
+            return self.object_factory(self.parse_members())
+
         token = self.advance()
 
         if token.tokenType != TokenType.LBRACE:
@@ -122,6 +130,34 @@ class Parser:
         
         return res
 
+    def parse_members(self) -> List[Tuple[str, Any]]:
+        """Same as parse_object but keeps the members as (key, value) pairs for the object factory"""
+        token = self.advance()
+
+        if token.tokenType != TokenType.LBRACE:
+            raise Exception(f"Expected start of object token, got {token}")
+
+        res = []
+
+        if self.peek().tokenType == TokenType.RBRACE:
+            self.advance()
+            return res
+
+        res.append(self.parse_member())
+
+        while self.peek().tokenType == TokenType.COMMA:
+            # consume the comma
+            self.advance()
+            res.append(self.parse_member())
+
+        if self.peek().tokenType != TokenType.RBRACE:
+            raise Exception(f"Expected closing brace to object, got {token}")
+
+        # fell through so consume the }
+        self.advance()
+
+        return res
+
     def parse_member(self) -> tuple[str, Any]:
         """<member> ::= <string> ': ' <json> ; A pair consisting of a name, and a JSON value"""
         token = self.advance()
@@ -138,3 +138,71 @@ def test_large_json(lexer, parser):
     result = parser(tokens=tokens).parse_json()
 
     assert {"numbers": list(range(10000))} == result
+
+def test_object_factory_pairs(lexer, parser):
+    json_input = '{"a": 1, "b": {"c": [true, null]}}'
+    tokens = lexer(source=json_input).tokenize()
+    result = parser(tokens=tokens, object_factory=list).parse_json()
+
+    assert [("a", 1), ("b", [("c", [True, None])])] == result
+
+def test_record_objects(lexer, parser):
+    from records import Record, RecordFactory
+
+    factory = RecordFactory()
+    tokens = lexer(path='./examples/server.json').tokenize()
+    result = parser(tokens=tokens, object_factory=factory).parse_json()
+
+    assert isinstance(result, Record)
+    assert result.name == "Cake"
+    assert result.ppu == 0.55
+    assert [batter.type for batter in result.batters.batter] == ["Regular", "Chocolate", "Blueberry", "Devil's Food"]
+    # every {"id", "type"} object shares one slotted class
+    assert type(result.topping[0]) is type(result.batters.batter[0])
+    assert not hasattr(result.topping[0], "__dict__")
+    assert result.topping[1]._asdict() == {"id": "5002", "type": "Glazed"}
+
+def test_record_objects_fallback(lexer, parser):
+    from records import RecordFactory
+
+    json_input = '[{"not an identifier": 1, "__dunder": 2, "_fields": 3}, {"class": 4}]'
+    tokens = lexer(source=json_input).tokenize()
+    result = parser(tokens=tokens, object_factory=RecordFactory()).parse_json()
+
+    assert [{"not an identifier": 1, "__dunder": 2, "_fields": 3}, {"class": 4}] == result
+
+def test_unslottable_keys_checked_once(lexer, parser, monkeypatch):
+    from records import RecordFactory
+
+    factory = RecordFactory()
+    calls = []
+    is_slottable = RecordFactory.is_slottable
+    monkeypatch.setattr(RecordFactory, "is_slottable", staticmethod(lambda keys: calls.append(keys) or is_slottable(keys)))
+
+    json_input = '[' + ', '.join(['{"with space": 1, "class": 2}'] * 100) + ']'
+    tokens = lexer(source=json_input).tokenize()
+    result = parser(tokens=tokens, object_factory=factory).parse_json()
+
+    assert [{"with space": 1, "class": 2}] * 100 == result
+    assert calls == [("with space", "class")]
+    assert factory.unslottable == {("with space", "class")}
+
+def test_record_objects_pickle(lexer, parser):
+    import pickle
+    from records import Record, RecordFactory
+
+    tokens = lexer(path='./examples/server.json').tokenize()
+    result = parser(tokens=tokens, object_factory=RecordFactory()).parse_json()
+    restored = pickle.loads(pickle.dumps(result))
+
+    assert isinstance(restored, Record)
+    assert restored == result
+    assert restored.batters.batter[0]._asdict() == {"id": "1001", "type": "Regular"}
+    assert type(restored.topping[0]) is type(restored.batters.batter[0])
+
+def test_empty_array_member(lexer, parser):
+    json_input = '{"empty": [], "after": [[], 1]}'
+    tokens = lexer(source=json_input).tokenize()
+    result = parser(tokens=tokens).parse_json()
+
+    assert {"empty": [], "after": [[], 1]} == result
@@ -0,0 +1,103 @@
+import keyword
+import threading
+from typing import Any, Dict, List, Set, Tuple, Union
+
+
+class Record:
+    """Base class for the slotted record classes built by RecordFactory"""
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self._fields, values):
+            object.__setattr__(self, name, value)
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # generated classes can't be looked up by name, so rebuild from the field names
+        return (_rebuild, (self._fields, tuple(getattr(self, name) for name in self._fields)))
+
+    def __eq__(self, other: object) -> bool:
+        # compare by fields rather than class so records from different factories still match
+        if not isinstance(other, Record):
+            return NotImplemented
+        if self._fields != other._fields:
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class RecordFactory:
+    """
+    Object factory for Parser that builds slotted Record instances instead of dicts.
+
+    One class is generated per distinct (ordered) key set and cached on the factory,
+    so documents with many same-shaped objects share a handful of classes. Objects whose
+    keys cannot be used as attribute names (non identifiers, keywords, dunder names,
+    duplicates or names clashing with Record itself) fall back to a plain dict.
+
+    A factory can be shared by parsers running on several threads, class creation is locked.
+    It can also be pickled to be sent to worker processes.
+    """
+
+    def __init__(self) -> None:
+        self.classes: Dict[Tuple[str, ...], type] = {}
+        # key sets that failed is_slottable, so each one is only checked once
+        self.unslottable: Set[Tuple[str, ...]] = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, pairs: List[Tuple[str, Any]]) -> Union[Record, Dict]:
+        keys = tuple(key for key, _ in pairs)
+        cls = self.classes.get(keys)
+
+        if cls is None:
+            if keys in self.unslottable:
+                return dict(pairs)
+            if not self.is_slottable(keys):
+                self.unslottable.add(keys)
+                return dict(pairs)
+            cls = self.make_class(keys)
+
+        return cls(*[value for _, value in pairs])
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks and generated classes can't be pickled, send the key sets and rebuild them
+        return {"keys": tuple(self.classes), "unslottable": tuple(self.unslottable)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+        self.unslottable.update(state["unslottable"])
+        for keys in state["keys"]:
+            self.make_class(keys)
+
+    def make_class(self, keys: Tuple[str, ...]) -> type:
+        with self.lock:
+            # another thread may have created it while we waited
+            cls = self.classes.get(keys)
+            if cls is None:
+                cls = type(f"Record{len(self.classes)}", (Record,), {"__slots__": keys, "_fields": keys})
+                self.classes[keys] = cls
+            return cls
+
+    @staticmethod
+    def is_slottable(keys: Tuple[str, ...]) -> bool:
+        if len(set(keys)) != len(keys):
+            return False
+        return all(
+            key.isidentifier() and not keyword.iskeyword(key) and not key.startswith("__") and not hasattr(Record, key)
+            for key in keys
+        )
+
+
+# classes for records that were unpickled, shared by every _rebuild call
+UNPICKLED = RecordFactory()
+
+
+def _rebuild(fields: Tuple[str, ...], values: Tuple[Any, ...]) -> Record:
+    cls = UNPICKLED.classes.get(fields) or UNPICKLED.make_class(fields)
+    return cls(*values)
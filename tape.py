@@ -0,0 +1,400 @@
+"""
+Flat binary "tape" representation of a parsed JSON document.
+
+The whole document lives in one contiguous buffer (bytearray, mmap, shared memory, ...)
+so it can be navigated with a TapeCursor without building any dicts or lists, and shared
+between processes without pickling.
+
+Layout (little endian):
+
+<tape>      ::= 'JTP1' <value>
+<value>     ::= 'n' | 't' | 'f'                          ; null, true, false
+              | 'i' int64                                ; integers that fit in 64 bits
+              | 'I' <bytes>                              ; bigger integers as decimal text
+              | 'd' float64
+              | 's' <bytes>                              ; utf-8 string data stored inline
+              | '[' end:uint64 count:uint32 *<value>
+              | '{' end:uint64 count:uint32 *('s' <bytes> <value>)
+<bytes>     ::= length:uint32 *byte
+
+`end` is the absolute offset just past the container so whole subtrees can be skipped.
+"""
+
+import struct
+from typing import Any, Iterator, List, Optional, Tuple, Union
+from multiprocessing import shared_memory
+
+from lexer import Token, TokenType
+
+MAGIC = b"JTP1"
+
+NULL = ord("n")
+TRUE = ord("t")
+FALSE = ord("f")
+INT = ord("i")
+BIGINT = ord("I")
+FLOAT = ord("d")
+STR = ord("s")
+ARRAY = ord("[")
+OBJECT = ord("{")
+
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+LENGTH = struct.Struct("<I")
+CONTAINER = struct.Struct("<QI")
+
+TAG_TYPES = {
+    NULL: TokenType.NULL,
+    TRUE: TokenType.BOOL,
+    FALSE: TokenType.BOOL,
+    INT: TokenType.NUM,
+    BIGINT: TokenType.NUM,
+    FLOAT: TokenType.NUM,
+    STR: TokenType.STR,
+    ARRAY: TokenType.LBRACKET,
+    OBJECT: TokenType.LBRACE,
+}
+
+
+class TapeBuilder:
+    """Walks the token stream with the Parser grammar but writes the tape instead of Python values"""
+
+    def __init__(self, tokens: List[Token]) -> None:
+        self.tokens = tokens
+        # index into the token array
+        self.current = 0
+        self.tape = bytearray(MAGIC)
+
+    def build(self) -> bytearray:
+        self.write_json()
+        return self.tape
+
+    def write_json(self) -> None:
+        """<json> ::= <primitive> | <container>"""
+        token = self.peek()
+
+        match token.tokenType:
+            case TokenType.LBRACKET:
+                self.write_array()
+            case TokenType.LBRACE:
+                self.write_object()
+            case _:
+                self.write_primitive()
+
+    def write_primitive(self) -> None:
+        """<primitive> ::= <number> | <string> | <boolean> | <null>"""
+        token = self.advance()
+
+        match token.tokenType:
+            case TokenType.NUM:
+                if '.' in token.value or 'e' in token.value.lower():
+                    self.tape.append(FLOAT)
+                    self.tape += FLOAT64.pack(float(token.value))
+                else:
+                    value = int(token.value)
+                    if -2**63 <= value < 2**63:
+                        self.tape.append(INT)
+                        self.tape += INT64.pack(value)
+                    else:
+                        self.tape.append(BIGINT)
+                        self.write_bytes(str(value).encode("ascii"))
+            case TokenType.STR:
+                self.write_string(token.value)
+            case TokenType.BOOL:
+                self.tape.append(TRUE if token.value == "true" else FALSE)
+            case TokenType.NULL:
+                self.tape.append(NULL)
+            case _:
+                raise Exception(f"Expected primitive token, got {token} mismatching type")
+
+    def write_array(self) -> None:
+        """<array> ::= '[' [ <json> *(', ' <json>) ] ']' ; A sequence of JSON values separated by commas"""
+        token = self.advance()
+        start = self.start_container(ARRAY)
+        count = 0
+
+        if self.peek().tokenType != TokenType.RBRACKET:
+            self.write_json()
+            count += 1
+
+            while self.peek().tokenType == TokenType.COMMA:
+                # consume the comma
+                self.advance()
+                self.write_json()
+                count += 1
+
+        if self.peek().tokenType != TokenType.RBRACKET:
+            raise Exception(f"Expected closing bracket to array, got {token}")
+
+        # fell through so consume the ]
+        self.advance()
+        self.end_container(start, count)
+
+    def write_object(self) -> None:
+        """<object> ::= '{' [ <member> *(', ' <member>) ] '}' ; A sequence of 'members'"""
+        token = self.advance()
+        start = self.start_container(OBJECT)
+        count = 0
+
+        if self.peek().tokenType != TokenType.RBRACE:
+            self.write_member()
+            count += 1
+
+            while self.peek().tokenType == TokenType.COMMA:
+                # consume the comma
+                self.advance()
+                self.write_member()
+                count += 1
+
+        if self.peek().tokenType != TokenType.RBRACE:
+            raise Exception(f"Expected closing brace to object, got {token}")
+
+        # fell through so consume the }
+        self.advance()
+        self.end_container(start, count)
+
+    def write_member(self) -> None:
+        """<member> ::= <string> ': ' <json> ; A pair consisting of a name, and a JSON value"""
+        token = self.advance()
+
+        if token.tokenType != TokenType.STR:
+            raise Exception(f"Expected string as key token for member, got {token}")
+
+        self.write_string(token.value)
+
+        token = self.advance()
+
+        if token.tokenType != TokenType.COLON:
+            raise Exception(f"Expected colon separator for member, got {token}")
+
+        self.write_json()
+
+    def start_container(self, tag: int) -> int:
+        start = len(self.tape)
+        self.tape.append(tag)
+        # end and count are patched in once the container is closed
+        self.tape += bytes(CONTAINER.size)
+        return start
+
+    def end_container(self, start: int, count: int) -> None:
+        CONTAINER.pack_into(self.tape, start + 1, len(self.tape), count)
+
+    def write_string(self, value: str) -> None:
+        self.tape.append(STR)
+        self.write_bytes(value.encode("utf-8", "surrogatepass"))
+
+    def write_bytes(self, data: bytes) -> None:
+        self.tape += LENGTH.pack(len(data))
+        self.tape += data
+
+    # looks at curr token DOES NOT REMOVE
+    def peek(self) -> Token:
+        if self.is_at_end():
+            raise Exception("Unexpected end of input")
+        return self.tokens[self.current]
+
+    # consume and return token
+    def advance(self) -> Token:
+        if self.is_at_end():
+            raise Exception("Unexpected end of input")
+        token = self.tokens[self.current]
+        self.current += 1
+        return token
+
+    def is_at_end(self) -> bool:
+        return self.current >= len(self.tokens)
+
+
+def build_tape(tokens: List[Token]) -> bytearray:
+    return TapeBuilder(tokens).build()
+
+
+def to_shared_memory(tape: Union[bytes, bytearray], name: Optional[str] = None) -> shared_memory.SharedMemory:
+    """Copy a tape into a new shared memory block, other processes can attach to it by name"""
+    shm = shared_memory.SharedMemory(name=name, create=True, size=len(tape))
+    shm.buf[:len(tape)] = tape
+    return shm
+
+
+def read_string(buffer, pos: int) -> Tuple[str, int]:
+    """Decode the <bytes> payload at pos, returns the string and the offset past it"""
+    (length,) = LENGTH.unpack_from(buffer, pos)
+    pos += LENGTH.size
+    return str(buffer[pos: pos + length], "utf-8", "surrogatepass"), pos + length
+
+
+def read_value(buffer, pos: int) -> Tuple[Any, int]:
+    """Materialize the value at pos into Python objects, returns the value and the offset past it"""
+    tag = buffer[pos]
+    pos += 1
+
+    if tag == STR:
+        return read_string(buffer, pos)
+    if tag == INT:
+        return INT64.unpack_from(buffer, pos)[0], pos + INT64.size
+    if tag == OBJECT:
+        _, count = CONTAINER.unpack_from(buffer, pos)
+        pos += CONTAINER.size
+        res = {}
+        for _ in range(count):
+            # skip the key's 's' tag
+            key, pos = read_string(buffer, pos + 1)
+            res[key], pos = read_value(buffer, pos)
+        return res, pos
+    if tag == ARRAY:
+        _, count = CONTAINER.unpack_from(buffer, pos)
+        pos += CONTAINER.size
+        res = []
+        for _ in range(count):
+            value, pos = read_value(buffer, pos)
+            res.append(value)
+        return res, pos
+    if tag == FLOAT:
+        return FLOAT64.unpack_from(buffer, pos)[0], pos + FLOAT64.size
+    if tag == TRUE:
+        return True, pos
+    if tag == FALSE:
+        return False, pos
+    if tag == NULL:
+        return None, pos
+    if tag == BIGINT:
+        text, pos = read_string(buffer, pos)
+        return int(text), pos
+
+    raise Exception(f"Corrupt tape, unknown tag {tag!r} at offset {pos - 1}")
+
+
+def skip_value(buffer, pos: int) -> int:
+    """Offset just past the value at pos, containers are skipped using their end offset"""
+    tag = buffer[pos]
+
+    if tag in (OBJECT, ARRAY):
+        return CONTAINER.unpack_from(buffer, pos + 1)[0]
+    if tag in (STR, BIGINT):
+        return pos + 1 + LENGTH.size + LENGTH.unpack_from(buffer, pos + 1)[0]
+    if tag in (INT, FLOAT):
+        return pos + 9
+    if tag in (NULL, TRUE, FALSE):
+        return pos + 1
+
+    raise Exception(f"Corrupt tape, unknown tag {tag!r} at offset {pos}")
+
+
+class TapeCursor:
+    """
+    Lazy view of a single value on a tape. Navigating (find_field, indexing, iterating)
+    only creates cursors, Python values are built once value() is called.
+    """
+
+    def __init__(self, buffer, pos: Optional[int] = None) -> None:
+        if pos is None:
+            if bytes(buffer[:len(MAGIC)]) != MAGIC:
+                raise Exception("Buffer does not start with a JSON tape header")
+            pos = len(MAGIC)
+
+        self.buffer = buffer
+        self.pos = pos
+
+    @property
+    def tag(self) -> int:
+        return self.buffer[self.pos]
+
+    @property
+    def type(self) -> TokenType:
+        """TokenType of the value, containers report their opening token (LBRACE / LBRACKET)"""
+        return TAG_TYPES[self.tag]
+
+    def value(self) -> Any:
+        return read_value(self.buffer, self.pos)[0]
+
+    def find_field(self, key: str) -> "TapeCursor":
+        """
+        Cursor to the value of member key, raises KeyError if the object has no such member.
+        With duplicate keys the last member wins, same as value() and Parser.parse_object.
+        """
+        target = key.encode("utf-8", "surrogatepass")
+        found = None
+
+        for key_pos, value_pos in self.members():
+            (length,) = LENGTH.unpack_from(self.buffer, key_pos + 1)
+            start = key_pos + 1 + LENGTH.size
+            if length == len(target) and self.buffer[start: start + length] == target:
+                found = value_pos
+
+        if found is None:
+            raise KeyError(key)
+
+        return TapeCursor(self.buffer, found)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self.find_field(key)
+        except KeyError:
+            return default
+
+    def items(self) -> Iterator[Tuple[str, "TapeCursor"]]:
+        for key_pos, value_pos in self.members():
+            key, _ = read_string(self.buffer, key_pos + 1)
+            yield key, TapeCursor(self.buffer, value_pos)
+
+    def members(self) -> Iterator[Tuple[int, int]]:
+        """(key offset, value offset) of every member of an object"""
+        if self.tag != OBJECT:
+            raise Exception(f"Expected object on tape, got {self.type}")
+
+        _, count = CONTAINER.unpack_from(self.buffer, self.pos + 1)
+        pos = self.pos + 1 + CONTAINER.size
+
+        for _ in range(count):
+            value_pos = skip_value(self.buffer, pos)
+            yield pos, value_pos
+            pos = skip_value(self.buffer, value_pos)
+
+    def elements(self) -> Iterator["TapeCursor"]:
+        if self.tag != ARRAY:
+            raise Exception(f"Expected array on tape, got {self.type}")
+
+        _, count = CONTAINER.unpack_from(self.buffer, self.pos + 1)
+        pos = self.pos + 1 + CONTAINER.size
+
+        for _ in range(count):
+            yield TapeCursor(self.buffer, pos)
+            pos = skip_value(self.buffer, pos)
+
+    def __len__(self) -> int:
+        if self.tag not in (OBJECT, ARRAY):
+            raise TypeError(f"Value of type {self.type} has no length")
+        return CONTAINER.unpack_from(self.buffer, self.pos + 1)[1]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Arrays yield element cursors, objects yield their keys like a dict"""
+        if self.tag == OBJECT:
+            return (key for key, _ in self.items())
+        return self.elements()
+
+    def __getitem__(self, item: Union[int, str]) -> "TapeCursor":
+        if isinstance(item, str):
+            return self.find_field(item)
+
+        length = len(self)
+        index = item + length if item < 0 else item
+        if not 0 <= index < length:
+            raise IndexError(f"Tape array index {item} out of range")
+
+        for i, element in enumerate(self.elements()):
+            if i == index:
+                return element
+
+        raise IndexError(f"Tape array index {item} out of range")
+
+    def __repr__(self) -> str:
+        return f"TapeCursor(type={self.type}, pos={self.pos})"
+
+
+if __name__ == "__main__":
+    from lexer import Lexer
+
+    tape = build_tape(Lexer(path="./examples/server.json").tokenize())
+    root = TapeCursor(tape)
+    print(f"{len(tape)} byte tape")
+    print(root["batters"]["batter"][-1]["type"].value())
@@ -0,0 +1,91 @@
+import pytest
+from lexer import Lexer, TokenType
+from parser import Parser
+from tape import TapeCursor, build_tape, to_shared_memory
+
+@pytest.fixture
+def tape():
+    def build(source=None, path=None):
+        lexer = Lexer(source=source) if source is not None else Lexer(path=path)
+        return build_tape(lexer.tokenize())
+    return build
+
+
+def test_round_trip(tape):
+    json_input = '{"a": [1, -2, 3.5, 1e3, 123456789012345678901234567890], "b": {"c": true, "d": false, "e": null}, "f": "text", "g": [], "h": {}}'
+    expected = Parser(Lexer(source=json_input).tokenize()).parse_json()
+
+    assert expected == TapeCursor(tape(source=json_input)).value()
+
+def test_server_json_round_trip(tape):
+    tokens = Lexer(path='./examples/server_complex.json').tokenize()
+
+    assert Parser(tokens).parse_json() == TapeCursor(build_tape(tokens)).value()
+
+def test_primitive_root(tape):
+    assert "only a string" == TapeCursor(tape(source='"only a string"')).value()
+
+def test_find_field(tape):
+    root = TapeCursor(tape(path='./examples/server.json'))
+
+    assert root.type == TokenType.LBRACE
+    assert root.find_field("name").value() == "Cake"
+    assert root["ppu"].type == TokenType.NUM
+    assert root["batters"]["batter"][3]["type"].value() == "Devil's Food"
+    assert root.get("missing") is None
+
+    with pytest.raises(KeyError):
+        root.find_field("missing")
+
+def test_array_access(tape):
+    root = TapeCursor(tape(source='[10, [20, 21], {"x": 30}, "forty"]'))
+
+    assert len(root) == 4
+    assert root[0].value() == 10
+    assert root[1][1].value() == 21
+    assert root[-1].value() == "forty"
+    assert [element.type for element in root] == [TokenType.NUM, TokenType.LBRACKET, TokenType.LBRACE, TokenType.STR]
+
+    with pytest.raises(IndexError):
+        root[4]
+
+def test_object_iteration(tape):
+    root = TapeCursor(tape(source='{"one": 1, "two": {"nested": 2}, "three": 3}'))
+
+    assert list(root) == ["one", "two", "three"]
+    assert [(key, value.value()) for key, value in root.items()] == [("one", 1), ("two", {"nested": 2}), ("three", 3)]
+
+def test_unicode_strings(tape):
+    root = TapeCursor(tape(source='{"café": "☃ snowman"}'))
+
+    assert root["café"].value() == "☃ snowman"
+
+def test_shared_memory(tape):
+    from multiprocessing import shared_memory
+
+    owner = to_shared_memory(tape(path='./examples/server.json'))
+    reader = shared_memory.SharedMemory(name=owner.name)
+    try:
+        root = TapeCursor(reader.buf)
+        assert root["topping"][6]["type"].value() == "Maple"
+        del root
+    finally:
+        reader.close()
+        owner.close()
+        owner.unlink()
+
+def test_not_a_tape():
+    with pytest.raises(Exception):
+        TapeCursor(b'{"key": "value"}')
+
+def test_invalid_tokens(tape):
+    for json_input in ['{"key": "value",}', '[1, 2', '{"key" 1}']:
+        with pytest.raises(Exception):
+            tape(source=json_input)
+
+def test_duplicate_keys(tape):
+    root = TapeCursor(tape(source='{"a": 1, "b": 2, "a": 3}'))
+
+    assert root["a"].value() == 3
+    assert root["a"].value() == root.value()["a"]
+    assert root.get("a").value() == 3
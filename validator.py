@@ -0,0 +1,228 @@
+"""
+Well-formedness check for the grammar in parser.py that builds no values.
+
+Strings, numbers and whitespace are skipped with compiled regexes and the structure is
+walked by position only, so no Token objects, decoded strings, numbers, dicts or lists are
+created. It accepts the same strings, numbers and keywords as the Lexer.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, overload
+
+from lexer import PathType, SourceType
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+# escape-free runs with valid escapes between them, same escapes as Lexer.lex_string.
+# The terminator is optional so a failed match still shows where the string went wrong
+STRING = re.compile(r'"[^"\\]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\]*)*(")?')
+NUMBER = re.compile(r'-?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?')
+KEYWORDS = {'t': 'true', 'f': 'false', 'n': 'null'}
+
+
+@dataclass
+class ValidationResult:
+    """Truthy when the document is valid, otherwise holds where the first error is"""
+    valid: bool
+    # offset into the source, line is 1 based and column is 0 based within the line
+    position: int = -1
+    line: int = 0
+    column: int = 0
+    message: str = ""
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+class ValidationError(Exception):
+    def __init__(self, position: int, message: str) -> None:
+        super().__init__(message)
+        self.position = position
+        self.message = message
+
+
+class Validator:
+    """
+    Walks <json> iteratively, open containers are kept on a stack of expected closers
+    so deeply nested documents don't hit the recursion limit.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.current = 0
+        self.closers: List[str] = []
+
+    def validate(self) -> None:
+        self.skip_whitespace()
+
+        while True:
+            self.validate_value()
+
+            # close finished containers until another element is expected
+            if not self.validate_separator():
+                break
+
+        self.skip_whitespace()
+
+        if not self.is_at_end():
+            raise ValidationError(self.current, f"Unexpected content after document: {self.describe()}")
+
+    def validate_value(self) -> None:
+        """
+        <json> ::= <primitive> | <container>
+        Opening a non empty container pushes its closer and stops at its first element.
+        """
+        while True:
+            char = self.peek()
+
+            match char:
+                case '{' | '[':
+                    closer = '}' if char == '{' else ']'
+                    self.current += 1
+                    self.skip_whitespace()
+
+                    if self.peek() == closer:
+                        self.current += 1
+                        return
+
+                    self.closers.append(closer)
+                    if closer == '}':
+                        self.validate_key()
+                case '"':
+                    self.skip_string()
+                    return
+                case 't' | 'f' | 'n':
+                    self.skip_keyword(KEYWORDS[char])
+                    return
+                case _:
+                    match = NUMBER.match(self.source, self.current)
+                    if match is None:
+                        raise ValidationError(self.current, f"Unexpected character in value: {self.describe()}")
+                    self.current = match.end()
+                    return
+
+    def validate_separator(self) -> bool:
+        """
+        <array> ::= '[' [ <json> *(', ' <json>) ] ']'
+        <object> ::= '{' [ <member> *(', ' <member>) ] '}'
+        Returns True when another element follows, False once every container is closed.
+        """
+        while self.closers:
+            self.skip_whitespace()
+            closer = self.closers[-1]
+            char = self.peek()
+
+            if char == closer:
+                self.current += 1
+                self.closers.pop()
+                continue
+
+            if char != ',':
+                container = "object" if closer == '}' else "array"
+                raise ValidationError(self.current, f"Expected comma or {closer} to close {container}, got {self.describe()}")
+
+            self.current += 1
+            self.skip_whitespace()
+
+            if closer == '}':
+                self.validate_key()
+            return True
+
+        return False
+
+    def validate_key(self) -> None:
+        """<member> ::= <string> ': ' <json> ; up to the start of the value"""
+        if self.peek() != '"':
+            raise ValidationError(self.current, f"Expected string as key for member, got {self.describe()}")
+
+        self.skip_string()
+        self.skip_whitespace()
+
+        if self.peek() != ':':
+            raise ValidationError(self.current, f"Expected colon separator for member, got {self.describe()}")
+
+        self.current += 1
+        self.skip_whitespace()
+
+    def skip_string(self) -> None:
+        match = STRING.match(self.source, self.current)
+
+        if match.group(1) is None:
+            # the match stops at the backslash of an invalid escape or at the end of input
+            position = match.end()
+            if position >= len(self.source):
+                raise ValidationError(position, "Expected string terminator, got end of input")
+            raise ValidationError(position, f"Invalid escape sequence {self.source[position: position + 2]!r}")
+
+        self.current = match.end()
+
+    def skip_keyword(self, keyword: str) -> None:
+        if not self.source.startswith(keyword, self.current):
+            raise ValidationError(self.current, f"Unexpected alpha sequence, expected {keyword}")
+
+        self.current += len(keyword)
+
+    def skip_whitespace(self) -> None:
+        self.current = WHITESPACE.match(self.source, self.current).end()
+
+    # describe the current char for error messages
+    def describe(self) -> str:
+        if self.is_at_end():
+            return "end of input"
+        return repr(self.source[self.current])
+
+    # looks at curr char DOES NOT REMOVE
+    def peek(self) -> str:
+        if self.is_at_end():
+            return '\0'
+        return self.source[self.current]
+
+    def is_at_end(self) -> bool:
+        return self.current >= len(self.source)
+
+
+@overload
+def validate(source: SourceType) -> ValidationResult: ...
+
+@overload
+def validate(*, path: PathType) -> ValidationResult: ...
+
+def validate(source: Optional[SourceType] = None, *, path: Optional[PathType] = None) -> ValidationResult:
+    """Check that source (or the file at path) is a single well-formed JSON document"""
+    if source is not None and path is not None:
+        raise ValueError("Cannot specify both source and path")
+    if source is None and path is None:
+        raise ValueError("Must specify either source or path")
+
+    if source is None:
+        with open(str(path)) as f:
+            source = f.read()
+
+    try:
+        Validator(source).validate()
+    except ValidationError as e:
+        return error_result(source, e.position, e.message)
+
+    return ValidationResult(True)
+
+
+def error_result(source: str, position: int, message: str) -> ValidationResult:
+    line_start = source.rfind('\n', 0, position) + 1
+    line = source.count('\n', 0, position) + 1
+    return ValidationResult(False, position, line, position - line_start, message)
+
+
+if __name__ == "__main__":
+    import time
+    from lexer import Lexer
+    from parser import Parser
+
+    source = '{"numbers": ' + str(list(range(20000))) + ', "text": ["escaped \\"string\\" \\u2603"]}'
+
+    start = time.perf_counter()
+    Parser(Lexer(source=source).tokenize()).parse_json()
+    print(f"tokenize + parse: {time.perf_counter() - start:.4f}s")
+
+    start = time.perf_counter()
+    print(validate(source))
+    print(f"validate: {time.perf_counter() - start:.4f}s")
@@ -0,0 +1,86 @@
+import pytest
+from validator import validate
+
+
+@pytest.mark.parametrize("json_input", [
+    '{"key": "value"}',
+    '{}',
+    '[]',
+    '[1, [2, [3, [4]]]]',
+    '{"array": [1, {"key": "value"}], "empty": {}, "number": 42}',
+    '{"true_key": true, "false_key": false, "null_key": null}',
+    '{"key": "value with \\n newlines and \\t tabs \\u2603 \\uD83D\\uDE80"}',
+    '  {"numbers": [-1, 0, 3.14, 1.23e4, 5.67E-8, -0.5e+3]}\n',
+    '"just a string"',
+    '-42',
+    'null',
+])
+def test_valid(json_input):
+    result = validate(json_input)
+
+    assert result
+    assert result.position == -1
+
+@pytest.mark.parametrize("json_input, position", [
+    ('{"key": "value",}', 16),
+    ('{"key" "value"}', 7),
+    ('{key: "value"}', 1),
+    ('[1, 2', 5),
+    ('[1 2]', 3),
+    ('[1,]', 3),
+    ('{"key": tru}', 8),
+    ('{"key": "bad \\x escape"}', 13),
+    ('{"key": "unterminated}', 22),
+    ('[1.]', 2),
+    ('[-]', 1),
+    ('{} {}', 3),
+    ('', 0),
+])
+def test_invalid(json_input, position):
+    result = validate(json_input)
+
+    assert not result
+    assert result.position == position
+    assert result.message
+
+def test_error_line_and_column():
+    result = validate('{\n  "a": 1,\n  "b": ]\n}')
+
+    assert (result.line, result.column) == (3, 7)
+
+def test_files():
+    assert validate(path='./examples/server.json')
+    assert validate(path='./examples/server_complex.json')
+
+def test_deep_nesting():
+    assert validate('[' * 100000 + ']' * 100000)
+    assert validate('{"a": ' * 5000 + '[{}]' + '}' * 5000)
+
+    result = validate('[' * 1200 + ']' * 1199)
+    assert (result.valid, result.position) == (False, 2399)
+    assert result.message.endswith("got end of input")
+
+    result = validate('{"a": ' * 1200 + '1' + '}' * 1199 + ']')
+    assert (result.valid, result.position) == (False, 6 * 1200 + 1 + 1199)
+
+def test_string_error_positions():
+    result = validate('"' + 'ab\\n' * 200000)
+    assert (result.position, result.message) == (len('"' + 'ab\\n' * 200000), "Expected string terminator, got end of input")
+
+    result = validate('["ok \\n", "bad \\q"]')
+    assert result.position == 15
+    assert "\\q" in result.message
+
+def test_end_of_input_messages():
+    for json_input in ['{"key"', '{"key":', '[1,', '']:
+        result = validate(json_input)
+        assert not result
+        assert result.position == len(json_input)
+        assert "end of input" in result.message
+        assert "\0" not in result.message
+
+def test_source_and_path():
+    with pytest.raises(ValueError):
+        validate('{}', path='./examples/server.json')
+    with pytest.raises(ValueError):
+        validate()